@@ -3,13 +3,18 @@ Parametric Building Configurator - REST API
 Exposes the construction logic engine as a FastAPI service for frontend consumption.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import validation_error_definition, validation_error_response_definition
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Optional, Any
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, ValidationError
+from typing import List, Dict, NamedTuple, Optional, Tuple, Any
 from enum import Enum
+from functools import cached_property
+import numpy as np
 import uvicorn
 import os
 from pathlib import Path
@@ -48,6 +53,13 @@ class ClimateZone(int, Enum):
     ZONE_8 = 8
 
 
+# Stud spacing per framing type. FramingType is a str Enum, so members and their
+# raw string values (stored under use_enum_values) hash to the same key.
+_STUD_SPACING: Dict[str, int] = {
+    ft.value: (24 if "24oc" in ft.value else 16) for ft in FramingType
+}
+
+
 # ============================================================================
 # PYDANTIC MODELS - API Request/Response Schemas
 # ============================================================================
@@ -65,7 +77,28 @@ class MaterialLayer(BaseModel):
         use_enum_values = True
 
 
-class Window(BaseModel):
+class _CachedModel(BaseModel):
+    """
+    Base for request models that memoize derived values with cached_property.
+    They are frozen and hold tuples rather than lists, so a cached value's inputs
+    can't change in place; model_copy() drops the cached values and re-runs
+    model_post_init, since update= replaces fields without re-running validation.
+    """
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        fields = type(copy).model_fields
+        for name in [name for name in copy.__dict__ if name not in fields]:
+            del copy.__dict__[name]
+        copy.model_post_init(None)
+        return copy
+
+    class Config:
+        use_enum_values = True
+        frozen = True
+
+
+class Window(_CachedModel):
     """
     Window component with egress and thermal properties.
     """
@@ -74,7 +107,7 @@ class Window(BaseModel):
     u_factor: float = Field(..., gt=0, le=2.0, description="Thermal transmittance", example=0.30)
     window_type: str = Field(default="Double-Hung", description="Window style", example="Double-Hung")
 
-    @property
+    @cached_property
     def area_sqft(self) -> float:
         """Total window area in square feet"""
         return (self.width_inches * self.height_inches) / 144.0
@@ -87,41 +120,39 @@ class Window(BaseModel):
         """
         return self.area_sqft * 0.9
 
-    class Config:
-        use_enum_values = True
-
 
-class Wall(BaseModel):
+class Wall(_CachedModel):
     """
     Intelligent wall component with framing, layers, and openings.
     """
     length_feet: float = Field(..., gt=0, description="Wall length in feet", example=12.0)
-    height_feet: float = Field(..., gt=0, description="Wall height in feet", example=8.0)
+    height_feet: float = Field(..., ge=6.0, le=20.0, description="Wall height in feet (residential: 6-20)", example=8.0)
     framing_type: FramingType = Field(..., description="Framing configuration")
     is_exterior: bool = Field(..., description="Exterior vs interior wall")
-    layers: List[MaterialLayer] = Field(default_factory=list, description="Wall assembly layers")
-    windows: List[Window] = Field(default_factory=list, description="Window openings")
+    layers: Tuple[MaterialLayer, ...] = Field(default_factory=tuple, description="Wall assembly layers")
+    windows: Tuple[Window, ...] = Field(default_factory=tuple, description="Window openings")
 
-    @validator('height_feet')
-    def validate_height(cls, v):
-        if v < 6.0:
-            raise ValueError('Wall height must be at least 6 feet')
-        if v > 20.0:
-            raise ValueError('Wall height cannot exceed 20 feet (residential)')
-        return v
+    # Total window area in sq ft, set in model_post_init (the model is frozen)
+    _window_area_total: float = PrivateAttr(default=0.0)
 
-    @property
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the total window area once the wall is validated"""
+        window_area = 0.0
+        for window in self.windows:
+            window_area += window.area_sqft
+        self._window_area_total = window_area
+
+    @cached_property
     def area_sqft(self) -> float:
         """Gross wall area"""
         return self.length_feet * self.height_feet
 
-    @property
+    @cached_property
     def net_area_sqft(self) -> float:
         """Wall area minus window openings"""
-        window_area = sum(w.area_sqft for w in self.windows)
-        return self.area_sqft - window_area
+        return self.area_sqft - self._window_area_total
 
-    @property
+    @cached_property
     def total_r_value(self) -> float:
         """Total thermal resistance of wall assembly"""
         return sum(layer.r_value for layer in self.layers)
@@ -129,24 +160,16 @@ class Wall(BaseModel):
     @property
     def stud_spacing_inches(self) -> int:
         """Extract stud spacing from framing type"""
-        framing_str = self.framing_type if isinstance(self.framing_type, str) else self.framing_type.value
-        if "16oc" in framing_str:
-            return 16
-        elif "24oc" in framing_str:
-            return 24
-        return 16
-
-    class Config:
-        use_enum_values = True
+        return _STUD_SPACING.get(self.framing_type, 16)
 
 
-class Room(BaseModel):
+class Room(_CachedModel):
     """
     Room assembly containing walls, openings, and spatial properties.
     """
     room_type: RoomType = Field(..., description="IRC room classification")
     ceiling_height_feet: float = Field(..., gt=0, description="Ceiling height in feet", example=8.0)
-    walls: List[Wall] = Field(..., min_items=1, description="Room walls")
+    walls: Tuple[Wall, ...] = Field(..., min_items=1, description="Room walls")
 
     @property
     def total_floor_area_sqft(self) -> float:
@@ -155,6 +178,11 @@ class Room(BaseModel):
             return self.walls[0].length_feet * self.walls[1].length_feet
         return 0.0
 
+    @cached_property
+    def exterior_walls(self) -> List[Tuple[int, Wall]]:
+        """Exterior walls paired with their index in walls"""
+        return [(i, wall) for i, wall in enumerate(self.walls) if wall.is_exterior]
+
     def get_all_windows(self) -> List[Window]:
         """Collect all windows from all walls"""
         windows = []
@@ -162,9 +190,6 @@ class Room(BaseModel):
             windows.extend(wall.windows)
         return windows
 
-    class Config:
-        use_enum_values = True
-
 
 class Project(BaseModel):
     """
@@ -175,6 +200,12 @@ class Project(BaseModel):
     climate_zone: ClimateZone = Field(..., description="IECC Climate Zone")
     rooms: List[Room] = Field(..., min_items=1, description="Project rooms")
 
+    @property
+    def required_rvalue(self) -> int:
+        """IECC minimum exterior wall R-value for the project's climate zone"""
+        # Climate zone range is already enforced by the ClimateZone enum
+        return _IECC_RVALUE[int(self.climate_zone)]
+
     class Config:
         use_enum_values = True
 
@@ -214,6 +245,35 @@ class CalculationResponse(BaseModel):
 # BUSINESS LOGIC - Material Calculator
 # ============================================================================
 
+def _sum_materials(length, height, spacing, ext_mask, win_area) -> Dict[str, float]:
+    """
+    BOM totals over wall columns (one entry per wall): length and height in feet,
+    stud spacing in inches, exterior flag and total window area in sq ft.
+    Every BOM path reduces through here, so they all round identically.
+    """
+    length = np.asarray(length, dtype=np.float64)
+    height = np.asarray(height, dtype=np.float64)
+    spacing = np.asarray(spacing, dtype=np.float64)
+    ext_mask = np.asarray(ext_mask, dtype=np.bool_)
+    win_area = np.asarray(win_area, dtype=np.float64)
+
+    # Vertical studs plus 3 plate pieces, all cut at wall height
+    studs = (length * 12 / spacing).astype(np.int64) + 1 + 3
+    area = length * height
+
+    return {
+        "studs_count": int(studs.sum()),
+        "stud_linear_feet": float((studs * height).sum()),
+        "top_plate_lf": float(length.sum() * 2),
+        "bottom_plate_lf": float(length.sum()),
+        "sheathing_sqft": float(area.sum()),
+        "drywall_sqft": float(area.sum()),
+        "insulation_sqft": float((area - win_area).sum()),
+        # Footer trench: 2ft wide x 0.5ft deep, exterior walls only
+        "gravel_cubic_yards": float(length[ext_mask].sum() * 2.0 * 0.5 / 27.0)
+    }
+
+
 class MaterialCalculator:
     """
     Calculates Bill of Materials (BOM) from building components.
@@ -233,239 +293,379 @@ class MaterialCalculator:
         - Sheathing/Drywall: Gross wall area
         - Gravel: Foundation trench (exterior walls only)
         """
-        materials = {}
-
-        # === FRAMING LUMBER ===
-        num_studs_vertical = int((wall.length_feet * 12) / wall.stud_spacing_inches) + 1
-        num_studs_plates = 3
-        total_studs = num_studs_vertical + num_studs_plates
-
-        materials["studs_count"] = total_studs
-        materials["stud_linear_feet"] = total_studs * wall.height_feet
-        materials["top_plate_lf"] = wall.length_feet * 2
-        materials["bottom_plate_lf"] = wall.length_feet
-
-        # === SHEATHING & FINISHES ===
-        materials["sheathing_sqft"] = wall.area_sqft
-        materials["drywall_sqft"] = wall.area_sqft
-
-        # === INSULATION ===
-        materials["insulation_sqft"] = wall.net_area_sqft
-
-        # === FOUNDATION GRAVEL ===
-        if wall.is_exterior:
-            trench_volume_cuft = wall.length_feet * 2.0 * 0.5
-            materials["gravel_cubic_yards"] = trench_volume_cuft / 27.0
-        else:
-            materials["gravel_cubic_yards"] = 0.0
-
-        return materials
-
-    @staticmethod
-    def calculate_room_materials(room: Room) -> Dict[str, float]:
-        """Aggregate materials for an entire room"""
-        totals = {
-            "studs_count": 0,
-            "stud_linear_feet": 0,
-            "top_plate_lf": 0,
-            "bottom_plate_lf": 0,
-            "sheathing_sqft": 0,
-            "drywall_sqft": 0,
-            "insulation_sqft": 0,
-            "gravel_cubic_yards": 0
-        }
-
-        for wall in room.walls:
-            wall_materials = MaterialCalculator.calculate_wall_materials(wall)
-            for key in totals:
-                totals[key] += wall_materials.get(key, 0)
-
-        return totals
+        return _sum_materials(
+            [wall.length_feet],
+            [wall.height_feet],
+            [wall.stud_spacing_inches],
+            [wall.is_exterior],
+            [wall._window_area_total]
+        )
 
     @staticmethod
     def calculate_project_materials(project: Project) -> Dict[str, float]:
-        """Aggregate materials for entire project"""
-        totals = {
-            "studs_count": 0,
-            "stud_linear_feet": 0,
-            "top_plate_lf": 0,
-            "bottom_plate_lf": 0,
-            "sheathing_sqft": 0,
-            "drywall_sqft": 0,
-            "insulation_sqft": 0,
-            "gravel_cubic_yards": 0
-        }
-
-        for room in project.rooms:
-            room_materials = MaterialCalculator.calculate_room_materials(room)
-            for key in totals:
-                totals[key] += room_materials.get(key, 0)
+        """
+        Aggregate materials for entire project.
 
-        return totals
+        Applies the same rules as calculate_wall_materials, but flattens every
+        wall into column arrays so each total is a single vectorized reduction.
+        """
+        walls = [wall for room in project.rooms for wall in room.walls]
+
+        return _sum_materials(
+            np.fromiter((w.length_feet for w in walls), dtype=np.float64, count=len(walls)),
+            np.fromiter((w.height_feet for w in walls), dtype=np.float64, count=len(walls)),
+            np.fromiter((w.stud_spacing_inches for w in walls), dtype=np.float64, count=len(walls)),
+            np.fromiter((w.is_exterior for w in walls), dtype=np.bool_, count=len(walls)),
+            np.fromiter((w._window_area_total for w in walls), dtype=np.float64, count=len(walls))
+        )
 
 
 # ============================================================================
 # BUSINESS LOGIC - Code Validator
 # ============================================================================
 
+# use_enum_values=True stores enum fields as their raw values, so room_type,
+# framing_type and climate_zone are plain str/int at runtime
+_BEDROOM = RoomType.BEDROOM.value
+
+# IECC R-Value Requirements by Climate Zone, keyed by the plain int zone number
+# that use_enum_values stores on Project.climate_zone
+_IECC_RVALUE: Dict[int, int] = {
+    1: 13,
+    2: 13,
+    3: 13,
+    4: 15,
+    5: 20,
+    6: 20,
+    7: 21,
+    8: 21
+}
+
+# One bit per code rule; validators OR these together to report which rules failed
+_RULE_R3051 = 1 << 0  # IRC R305.1 ceiling height
+_RULE_R3101 = 1 << 1  # IRC R310.1 bedroom egress
+_RULE_R4021 = 1 << 2  # IECC R402.1 thermal envelope
+
+# Code thresholds, references and message templates shared by every check
+_MIN_CEILING_HEIGHT = 7.0  # ft
+_MIN_CLEAR_OPENING = 5.7  # sq ft
+
+_CODE_R3051 = "IRC R305.1"
+_CODE_R3101 = "IRC R310.1"
+_CODE_R4021 = "IECC R402.1"
+_SEV_ERROR = "ERROR"
+
+_MSG_CEILING_HEIGHT = "Ceiling height {}ft is below minimum {}ft".format
+_MSG_NO_EGRESS_WINDOW = "Bedroom requires at least one egress window"
+_MSG_EGRESS_TOO_SMALL = (
+    "No window meets egress requirement. "
+    "Required: {} sq ft, "
+    "Largest found: {:.2f} sq ft"
+).format
+_MSG_RVALUE = "Exterior wall R-value {:.1f} below required {} for Climate Zone {}".format
+
+
 class CodeValidator:
     """
     Validates building components against IRC and IECC requirements.
     """
 
-    # IECC R-Value Requirements by Climate Zone
-    IECC_RVALUE_REQUIREMENTS = {
-        ClimateZone.ZONE_1: 13,
-        ClimateZone.ZONE_2: 13,
-        ClimateZone.ZONE_3: 13,
-        ClimateZone.ZONE_4: 15,
-        ClimateZone.ZONE_5: 20,
-        ClimateZone.ZONE_6: 20,
-        ClimateZone.ZONE_7: 21,
-        ClimateZone.ZONE_8: 21
-    }
-
     @staticmethod
-    def validate_project(project: Project) -> List[ComplianceResult]:
-        """Run all code compliance checks for entire project"""
+    def validate_project(project: Project) -> Tuple[int, List[ComplianceResult]]:
+        """
+        Run all code compliance checks for entire project.
+        Returns the bitmask of failed rules (0 = compliant) and the violations.
+        """
+        all_failed = 0
         all_errors = []
 
         for room_idx, room in enumerate(project.rooms):
-            room_errors = CodeValidator.validate_room(room, project)
-
-            # Add room context to errors
-            for error in room_errors:
-                room_type_str = room.room_type if isinstance(room.room_type, str) else room.room_type.value
-                if error.component:
-                    error.component = f"Room {room_idx + 1} ({room_type_str}) - {error.component}"
-                else:
-                    error.component = f"Room {room_idx + 1} ({room_type_str})"
-
+            failed, room_errors = CodeValidator.validate_room(room, project)
+            all_failed |= failed
+            CodeValidator._add_room_context(room_errors, room_idx, room)
             all_errors.extend(room_errors)
 
-        return all_errors
+        return all_failed, all_errors
 
     @staticmethod
-    def validate_room(room: Room, project: Project) -> List[ComplianceResult]:
-        """Run all code compliance checks for a room"""
-        errors = []
+    def _add_room_context(errors: List[ComplianceResult], room_idx: int, room: Room) -> None:
+        """Prefix each error's component with the room it was found in"""
+        for error in errors:
+            if error.component:
+                error.component = f"Room {room_idx + 1} ({room.room_type}) - {error.component}"
+            else:
+                error.component = f"Room {room_idx + 1} ({room.room_type})"
 
+    @staticmethod
+    def validate_room(room: Room, project: Project) -> Tuple[int, List[ComplianceResult]]:
+        """Run all code compliance checks for a room"""
         # Check 1: Minimum Ceiling Height
-        errors.extend(CodeValidator._check_ceiling_height(room))
+        failed, errors = CodeValidator._check_ceiling_height(room)
 
         # Check 2: Bedroom Egress Requirements
-        if room.room_type == RoomType.BEDROOM:
-            errors.extend(CodeValidator._check_bedroom_egress(room))
+        if room.room_type == _BEDROOM:
+            rule, rule_errors = CodeValidator._check_bedroom_egress(room)
+            failed |= rule
+            errors.extend(rule_errors)
 
         # Check 3: Thermal Envelope
-        errors.extend(CodeValidator._check_thermal_envelope(room, project))
+        rule, rule_errors = CodeValidator._check_thermal_envelope(room, project)
+        failed |= rule
+        errors.extend(rule_errors)
 
-        return errors
+        return failed, errors
 
     @staticmethod
-    def _check_ceiling_height(room: Room) -> List[ComplianceResult]:
+    def _check_ceiling_height(room: Room) -> Tuple[int, List[ComplianceResult]]:
         """IRC R305.1: Habitable rooms require minimum 7ft ceiling height"""
         errors = []
-        MIN_HEIGHT = 7.0
-
-        if room.ceiling_height_feet < MIN_HEIGHT:
-            room_type_str = room.room_type if isinstance(room.room_type, str) else room.room_type.value
-            errors.append(ComplianceResult(
-                code="IRC R305.1",
-                severity="ERROR",
-                message=f"Ceiling height {room.ceiling_height_feet}ft is below minimum {MIN_HEIGHT}ft",
-                component=f"{room_type_str}"
+
+        if room.ceiling_height_feet < _MIN_CEILING_HEIGHT:
+            errors.append(ComplianceResult.model_construct(
+                code=_CODE_R3051,
+                severity=_SEV_ERROR,
+                message=_MSG_CEILING_HEIGHT(room.ceiling_height_feet, _MIN_CEILING_HEIGHT),
+                component=f"{room.room_type}"
             ))
+            return _RULE_R3051, errors
 
-        return errors
+        return 0, errors
 
     @staticmethod
-    def _check_bedroom_egress(room: Room) -> List[ComplianceResult]:
+    def _check_bedroom_egress(room: Room) -> Tuple[int, List[ComplianceResult]]:
         """IRC R310.1: Bedrooms require emergency escape/rescue opening"""
         errors = []
-        MIN_CLEAR_OPENING = 5.7  # sq ft
-
-        windows = room.get_all_windows()
-
-        if not windows:
-            room_type_str = room.room_type if isinstance(room.room_type, str) else room.room_type.value
-            errors.append(ComplianceResult(
-                code="IRC R310.1",
-                severity="ERROR",
-                message="Bedroom requires at least one egress window",
-                component=f"{room_type_str}"
-            ))
-            return errors
 
+        # Single pass over every window: stop at the first compliant opening,
+        # otherwise finish with the largest opening for the error message
+        max_opening = 0.0
         has_compliant_egress = False
-        for window in windows:
-            if window.clear_opening_sqft >= MIN_CLEAR_OPENING:
+        for window in (w for wall in room.walls for w in wall.windows):
+            opening = window.clear_opening_sqft
+            if opening > max_opening:
+                max_opening = opening
+            if opening >= _MIN_CLEAR_OPENING:
                 has_compliant_egress = True
                 break
 
-        if not has_compliant_egress:
-            max_opening = max(w.clear_opening_sqft for w in windows)
-            room_type_str = room.room_type if isinstance(room.room_type, str) else room.room_type.value
-            errors.append(ComplianceResult(
-                code="IRC R310.1",
-                severity="ERROR",
-                message=f"No window meets egress requirement. "
-                        f"Required: {MIN_CLEAR_OPENING} sq ft, "
-                        f"Largest found: {max_opening:.2f} sq ft",
-                component=f"{room_type_str}"
+        if has_compliant_egress:
+            return 0, errors
+
+        # Window dimensions are validated > 0, so a zero max means no windows
+        if max_opening == 0.0:
+            errors.append(ComplianceResult.model_construct(
+                code=_CODE_R3101,
+                severity=_SEV_ERROR,
+                message=_MSG_NO_EGRESS_WINDOW,
+                component=f"{room.room_type}"
+            ))
+        else:
+            errors.append(ComplianceResult.model_construct(
+                code=_CODE_R3101,
+                severity=_SEV_ERROR,
+                message=_MSG_EGRESS_TOO_SMALL(_MIN_CLEAR_OPENING, max_opening),
+                component=f"{room.room_type}"
             ))
 
-        return errors
+        return _RULE_R3101, errors
 
     @staticmethod
-    def _check_thermal_envelope(room: Room, project: Project) -> List[ComplianceResult]:
+    def _check_thermal_envelope(room: Room, project: Project) -> Tuple[int, List[ComplianceResult]]:
         """IECC R402.1: Exterior walls must meet minimum R-value"""
         errors = []
-        required_rvalue = CodeValidator.IECC_RVALUE_REQUIREMENTS.get(
-            project.climate_zone, 20
+        required_rvalue = project.required_rvalue
+
+        for i, wall in room.exterior_walls:
+            error = CodeValidator._check_wall_rvalue(i, wall, required_rvalue, project)
+            if error is not None:
+                errors.append(error)
+
+        return (_RULE_R4021 if errors else 0), errors
+
+    @staticmethod
+    def _check_wall_rvalue(wall_idx: int, wall: Wall, required_rvalue: int,
+                           project: Project) -> Optional[ComplianceResult]:
+        """IECC R402.1 result for an exterior wall below the required R-value, else None"""
+        if wall.total_r_value >= required_rvalue:
+            return None
+        return ComplianceResult.model_construct(
+            code=_CODE_R4021,
+            severity=_SEV_ERROR,
+            message=_MSG_RVALUE(wall.total_r_value, required_rvalue, project.climate_zone),
+            component=f"Wall #{wall_idx+1} ({wall.framing_type})"
         )
 
+
+# ============================================================================
+# BUSINESS LOGIC - Fused Project Analysis
+# ============================================================================
+
+class ProjectAnalysis(NamedTuple):
+    """Compliance, BOM totals and summary counts for a whole project"""
+    failed_rules: int
+    compliance: List[ComplianceResult]
+    bom: Dict[str, float]
+    total_walls: int
+    total_windows: int
+
+
+def analyze_project(project: Project) -> ProjectAnalysis:
+    """
+    Validate a project and take off its materials in one traversal of its rooms.
+
+    Produces the same results as CodeValidator.validate_project plus
+    MaterialCalculator.calculate_project_materials: room-level checks run once
+    per room, while the IECC R-value check, the BOM wall columns and the summary
+    counts share the inner wall loop. The columns go through the same
+    _sum_materials reduction as /bom, so both endpoints round identically.
+    """
+    required_rvalue = project.required_rvalue
+
+    failed_rules = 0
+    compliance = []
+    total_walls = 0
+    total_windows = 0
+    length, height, spacing, ext_mask, win_area = [], [], [], [], []
+
+    for room_idx, room in enumerate(project.rooms):
+        # Room-level checks: ceiling height, bedroom egress
+        rule, room_errors = CodeValidator._check_ceiling_height(room)
+        failed_rules |= rule
+        if room.room_type == _BEDROOM:
+            rule, egress_errors = CodeValidator._check_bedroom_egress(room)
+            failed_rules |= rule
+            room_errors.extend(egress_errors)
+
+        total_walls += len(room.walls)
         for i, wall in enumerate(room.walls):
+            # Wall-level check: thermal envelope
             if wall.is_exterior:
-                if wall.total_r_value < required_rvalue:
-                    climate_zone_str = project.climate_zone if isinstance(project.climate_zone, int) else project.climate_zone.value
-                    framing_type_str = wall.framing_type if isinstance(wall.framing_type, str) else wall.framing_type.value
-                    errors.append(ComplianceResult(
-                        code="IECC R402.1",
-                        severity="ERROR",
-                        message=f"Exterior wall R-value {wall.total_r_value:.1f} "
-                                f"below required {required_rvalue} for Climate Zone {climate_zone_str}",
-                        component=f"Wall #{i+1} ({framing_type_str})"
-                    ))
+                error = CodeValidator._check_wall_rvalue(i, wall, required_rvalue, project)
+                if error is not None:
+                    failed_rules |= _RULE_R4021
+                    room_errors.append(error)
 
-        return errors
+            # BOM columns
+            length.append(wall.length_feet)
+            height.append(wall.height_feet)
+            spacing.append(wall.stud_spacing_inches)
+            ext_mask.append(wall.is_exterior)
+            win_area.append(wall._window_area_total)
+
+            total_windows += len(wall.windows)
+
+        CodeValidator._add_room_context(room_errors, room_idx, room)
+        compliance.extend(room_errors)
+
+    bom = _sum_materials(length, height, spacing, ext_mask, win_area)
+
+    return ProjectAnalysis(failed_rules, compliance, bom, total_walls, total_windows)
 
 
 # ============================================================================
 # FASTAPI APPLICATION
 # ============================================================================
 
+# Interactive docs are served by default in development and switched off when
+# ENVIRONMENT=production, so cold starts skip OpenAPI generation. ENABLE_DOCS=1/0
+# overrides either default.
+ENABLE_DOCS = os.getenv(
+    "ENABLE_DOCS", "0" if os.getenv("ENVIRONMENT") == "production" else "1"
+) == "1"
+
 app = FastAPI(
     title="Parametric Building Configurator API",
     description="REST API for construction code validation and material calculation",
     version="1.0.0",
-    docs_url="/docs",  # Swagger UI at /docs
-    redoc_url="/redoc"  # ReDoc at /redoc
+    docs_url="/docs" if ENABLE_DOCS else None,  # Swagger UI at /docs
+    redoc_url="/redoc" if ENABLE_DOCS else None,  # ReDoc at /redoc
+    openapi_url="/openapi.json" if ENABLE_DOCS else None
 )
 
 # ============================================================================
 # CORS MIDDLEWARE - Enable Cross-Origin Requests
 # ============================================================================
 
+# Comma-separated list of frontend origins; defaults to the Vite dev server
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins (React dev server, etc.)
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods (GET, POST, etc.)
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=["GET", "POST"],  # The only methods the API exposes
+    allow_headers=["content-type"],  # The frontend only sends JSON bodies
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 
+# ============================================================================
+# (DE)SERIALIZATION - Pydantic adapters built once at import
+# ============================================================================
+
+# Reused for every request: validate_json parses request bytes and dump_json
+# renders responses in pydantic-core, with no intermediate Python dicts.
+_ADAPTERS: Dict[Any, TypeAdapter] = {
+    tp: TypeAdapter(tp)
+    for tp in (Project, BillOfMaterials, List[ComplianceResult], CalculationResponse)
+}
+
+# The POST endpoints take a raw Request, so FastAPI no longer documents the body.
+# Publish the Project schema manually and hoist its nested models into components.
+_PROJECT_SCHEMA = _ADAPTERS[Project].json_schema(ref_template="#/components/schemas/{model}")
+_PROJECT_SCHEMA_DEFS = _PROJECT_SCHEMA.pop("$defs", {})
+_PROJECT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _PROJECT_SCHEMA}}
+    }
+}
+
+# Invalid bodies still raise RequestValidationError, so keep documenting the 422
+_VALIDATION_ERROR_RESPONSE = {
+    422: {
+        "description": "Validation Error",
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}}
+    }
+}
+
+_default_openapi = app.openapi
+
+
+def _openapi_with_project_schemas() -> Dict[str, Any]:
+    """Generate the OpenAPI schema, adding the models referenced by Project and the 422 body"""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        schemas = schema.setdefault("components", {}).setdefault("schemas", {})
+        schemas.update(_PROJECT_SCHEMA_DEFS)
+        schemas.setdefault("ValidationError", validation_error_definition)
+        schemas.setdefault("HTTPValidationError", validation_error_response_definition)
+    return app.openapi_schema
+
+
+app.openapi = _openapi_with_project_schemas
+
+
+async def parse_project(request: Request) -> Project:
+    """
+    Validate the request body as a Project.
+
+    Raises:
+        RequestValidationError: If the body is not a valid Project (HTTP 422)
+    """
+    try:
+        return _ADAPTERS[Project].validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
+
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
@@ -477,13 +677,20 @@ def read_root():
         "status": "online",
         "service": "Parametric Building Configurator API",
         "version": "1.0.0",
-        "docs": "/docs"
+        "docs": "/docs" if ENABLE_DOCS else None
     }
 
 
-@app.post("/api/calculate", response_model=CalculationResponse)
-@app.post("/calculate", response_model=CalculationResponse, include_in_schema=False)
-def calculate_project(project: Project):
+# Response bodies are built from trusted server-side values, so the POST endpoints
+# serialize them with the cached adapters instead of re-validating against a
+# response_model. The schemas stay declared under `responses=` for the OpenAPI docs.
+# The endpoints are async only to read the body; validation and takeoff are CPU-bound
+# and run in the threadpool so a large project doesn't block the event loop.
+
+@app.post("/api/calculate", responses={200: {"model": CalculationResponse}, **_VALIDATION_ERROR_RESPONSE},
+          openapi_extra=_PROJECT_REQUEST_BODY)
+@app.post("/calculate", include_in_schema=False)
+async def calculate_project(request: Request):
     """
     Main calculation endpoint.
 
@@ -491,7 +698,7 @@ def calculate_project(project: Project):
     Returns code compliance results and bill of materials.
 
     Args:
-        project: Project model with room definitions
+        request: Request whose JSON body is a Project with room definitions
 
     Returns:
         CalculationResponse with compliance checks and BOM
@@ -499,15 +706,16 @@ def calculate_project(project: Project):
     Raises:
         HTTPException: If validation or calculation fails
     """
-    try:
-        # Run code compliance validation
-        compliance_results = CodeValidator.validate_project(project)
+    project = await parse_project(request)
 
-        # Calculate bill of materials
-        bom_dict = MaterialCalculator.calculate_project_materials(project)
+    try:
+        # Run code compliance validation and the BOM takeoff in one pass
+        analysis = await run_in_threadpool(analyze_project, project)
+        compliance_results = analysis.compliance
+        bom_dict = analysis.bom
 
-        # Convert to Pydantic model
-        bom = BillOfMaterials(
+        # Convert to Pydantic model (values are server-computed, skip validation)
+        bom = BillOfMaterials.model_construct(
             studs_count=int(bom_dict["studs_count"]),
             stud_linear_feet=round(bom_dict["stud_linear_feet"], 2),
             top_plate_lf=round(bom_dict["top_plate_lf"], 2),
@@ -519,72 +727,80 @@ def calculate_project(project: Project):
         )
 
         # Generate summary statistics
-        total_windows = 0
-        for room in project.rooms:
-            for wall in room.walls:
-                total_windows += len(wall.windows)
-
         summary = {
             "project_name": project.name,
             "location": project.location_zip,
-            "climate_zone": project.climate_zone if isinstance(project.climate_zone, int) else project.climate_zone.value,
+            "climate_zone": project.climate_zone,
             "total_rooms": len(project.rooms),
-            "total_walls": sum(len(room.walls) for room in project.rooms),
-            "total_windows": total_windows,
-            "compliance_status": "PASS" if len(compliance_results) == 0 else "FAIL",
+            "total_walls": analysis.total_walls,
+            "total_windows": analysis.total_windows,
+            "compliance_status": "PASS" if analysis.failed_rules == 0 else "FAIL",
             "violation_count": len(compliance_results)
         }
 
-        return CalculationResponse(
+        result = CalculationResponse.model_construct(
             compliance=compliance_results,
             bom=bom,
             summary=summary
         )
+        return Response(
+            content=_ADAPTERS[CalculationResponse].dump_json(result),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
-@app.post("/api/validate", response_model=List[ComplianceResult])
-@app.post("/validate", response_model=List[ComplianceResult], include_in_schema=False)
-def validate_only(project: Project):
+@app.post("/api/validate", responses={200: {"model": List[ComplianceResult]}, **_VALIDATION_ERROR_RESPONSE},
+          openapi_extra=_PROJECT_REQUEST_BODY)
+@app.post("/validate", include_in_schema=False)
+async def validate_only(request: Request):
     """
     Code validation endpoint (no BOM calculation).
 
     Useful for quick compliance checks without material calculations.
 
     Args:
-        project: Project model with room definitions
+        request: Request whose JSON body is a Project with room definitions
 
     Returns:
         List of compliance violations (empty if all checks pass)
     """
+    project = await parse_project(request)
+
     try:
-        compliance_results = CodeValidator.validate_project(project)
-        return compliance_results
+        _, compliance_results = await run_in_threadpool(CodeValidator.validate_project, project)
+        return Response(
+            content=_ADAPTERS[List[ComplianceResult]].dump_json(compliance_results),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
 
 
-@app.post("/api/bom", response_model=BillOfMaterials)
-@app.post("/bom", response_model=BillOfMaterials, include_in_schema=False)
-def calculate_bom_only(project: Project):
+@app.post("/api/bom", responses={200: {"model": BillOfMaterials}, **_VALIDATION_ERROR_RESPONSE},
+          openapi_extra=_PROJECT_REQUEST_BODY)
+@app.post("/bom", include_in_schema=False)
+async def calculate_bom_only(request: Request):
     """
     Bill of Materials endpoint (no validation).
 
     Calculates material quantities without running code checks.
 
     Args:
-        project: Project model with room definitions
+        request: Request whose JSON body is a Project with room definitions
 
     Returns:
         BillOfMaterials with all material quantities
     """
+    project = await parse_project(request)
+
     try:
-        bom_dict = MaterialCalculator.calculate_project_materials(project)
+        bom_dict = await run_in_threadpool(MaterialCalculator.calculate_project_materials, project)
 
-        bom = BillOfMaterials(
+        bom = BillOfMaterials.model_construct(
             studs_count=int(bom_dict["studs_count"]),
             stud_linear_feet=round(bom_dict["stud_linear_feet"], 2),
             top_plate_lf=round(bom_dict["top_plate_lf"], 2),
@@ -595,7 +811,10 @@ def calculate_bom_only(project: Project):
             gravel_cubic_yards=round(bom_dict["gravel_cubic_yards"], 2)
         )
 
-        return bom
+        return Response(
+            content=_ADAPTERS[BillOfMaterials].dump_json(bom),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"BOM calculation error: {str(e)}")
@@ -635,18 +854,29 @@ if __name__ == "__main__":
     print("=" * 80)
     print()
     print("Server running at: http://localhost:8000")
-    print("API Documentation: http://localhost:8000/docs")
-    print("ReDoc: http://localhost:8000/redoc")
+    if ENABLE_DOCS:
+        print("API Documentation: http://localhost:8000/docs")
+        print("ReDoc: http://localhost:8000/redoc")
     print()
-    print("CORS enabled for all origins (React dev server compatible)")
+    print(f"CORS enabled for: {', '.join(CORS_ORIGINS)}")
     print()
     print("Press CTRL+C to stop the server")
     print("=" * 80)
     print()
 
+    # uvloop ships with uvicorn[standard] but has no Windows build
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     uvicorn.run(
-        app,
+        "api:app",  # Import string is required when running multiple workers
         host="0.0.0.0",  # Listen on all network interfaces
         port=8000,
-        log_level="info"
+        log_level="info",
+        loop=loop,
+        http="httptools",
+        workers=os.cpu_count()
     )
@@ -4,10 +4,15 @@ A construction logic engine that treats building elements as intelligent data ob
 with embedded code compliance and material calculation capabilities.
 """
 
+import io
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from functools import cached_property, lru_cache, partial
+from typing import List, Dict, Literal, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 # ============================================================================
 # ENUMERATIONS - Domain-Specific Types
@@ -46,7 +51,7 @@ class ClimateZone(Enum):
 # DATA STRUCTURES - The Kit of Parts
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MaterialLayer:
     """
     Represents a single layer in a wall assembly.
@@ -60,7 +65,32 @@ class MaterialLayer:
         return f"{self.name} ({self.thickness_inches}\" @ R-{self.r_value})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class Assembly:
+    """
+    Immutable wall assembly: an ordered stack of material layers.
+    One instance is shared by every wall built to the same spec, so its
+    R-value is summed once here rather than per wall.
+    """
+    layers: Tuple[MaterialLayer, ...] = ()
+    total_r_value: float = field(init=False)
+
+    def __post_init__(self):
+        # Sum of all layer R-values (series resistance)
+        object.__setattr__(self, "total_r_value", sum(layer.r_value for layer in self.layers))
+
+    def __iter__(self):
+        return iter(self.layers)
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+
+# Shared default for walls without layers (Assembly is immutable)
+NO_LAYERS = Assembly()
+
+
+@dataclass(frozen=True)
 class Window:
     """
     Window component with egress and thermal properties.
@@ -70,12 +100,12 @@ class Window:
     u_factor: float  # Thermal transmittance (BTU/h·ft²·°F)
     window_type: str = "Double-Hung"
 
-    @property
+    @cached_property
     def area_sqft(self) -> float:
         """Total window area in square feet"""
         return (self.width_inches * self.height_inches) / 144.0
 
-    @property
+    @cached_property
     def clear_opening_sqft(self) -> float:
         """
         IRC requires "clear opening" for egress calculations.
@@ -87,7 +117,7 @@ class Window:
         return f"Window {self.width_inches}\"x{self.height_inches}\" (U={self.u_factor})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Wall:
     """
     Intelligent wall component with framing, layers, and openings.
@@ -97,9 +127,14 @@ class Wall:
     height_feet: float
     framing_type: FramingType
     is_exterior: bool
-    layers: List[MaterialLayer] = field(default_factory=list)
+    layers: Assembly = NO_LAYERS
     windows: List[Window] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Accept a plain sequence of layers for convenience
+        if not isinstance(self.layers, Assembly):
+            self.layers = Assembly(tuple(self.layers))
+
     @property
     def area_sqft(self) -> float:
         """Gross wall area"""
@@ -115,9 +150,13 @@ class Wall:
     def total_r_value(self) -> float:
         """
         Total thermal resistance of wall assembly.
-        Sum of all layer R-values (series resistance).
+        Precomputed once per shared Assembly; a plain list of layers
+        assigned after construction is summed directly.
         """
-        return sum(layer.r_value for layer in self.layers)
+        layers = self.layers
+        if isinstance(layers, Assembly):
+            return layers.total_r_value
+        return sum(layer.r_value for layer in layers)
 
     @property
     def stud_spacing_inches(self) -> int:
@@ -133,7 +172,7 @@ class Wall:
         return f"Wall [{location}] {self.length_feet}'x{self.height_feet}' ({self.framing_type.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """
     Room assembly containing walls, openings, and spatial properties.
@@ -169,12 +208,111 @@ class Project:
     location_zip: str
     climate_zone: ClimateZone
     rooms: List[Room] = field(default_factory=list)
+    # IECC minimum wall R-value for climate_zone, kept in step by __setattr__
+    required_rvalue: int = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == "climate_zone":
+            object.__setattr__(
+                self, "required_rvalue", CodeValidator.IECC_RVALUE_REQUIREMENTS.get(value, 20)
+            )
 
 
 # ============================================================================
 # MATERIAL CALCULATOR - The Construction Math Engine
 # ============================================================================
 
+# Column order of the per-wall BOM rows produced by the JIT kernel
+BOM_COLS = (
+    "studs_count",
+    "stud_linear_feet",
+    "top_plate_lf",
+    "bottom_plate_lf",
+    "sheathing_sqft",
+    "drywall_sqft",
+    "insulation_sqft",
+    "gravel_cubic_yards",
+)
+
+@lru_cache(maxsize=None)
+def _wall_bom_kernel():
+    """
+    Compile the native-code BOM kernel on first use, or return None when numba
+    is missing or fails to compile, so callers fall back to NumPy. The kernel
+    fills the framing, panel and insulation columns of `out` (columns as
+    BOM_COLS, without gravel) per wall, using the same rules as the NumPy path.
+    """
+    try:
+        from numba import njit
+
+        @njit(fastmath=True)
+        def kernel(L, H, SP, NET, GROSS, out):
+            for i in range(L.shape[0]):
+                studs = int(L[i] * 12 / SP[i]) + 1 + 3
+                out[i, 0] = studs
+                out[i, 1] = studs * H[i]
+                out[i, 2] = L[i] * 2
+                out[i, 3] = L[i]
+                out[i, 4] = GROSS[i]
+                out[i, 5] = GROSS[i]
+                out[i, 6] = NET[i]
+
+        # Compile here with a single dummy wall rather than inside a caller's hot loop
+        kernel(np.ones(1), np.ones(1), np.ones(1), np.ones(1), np.ones(1),
+               np.empty((1, len(BOM_COLS) - 1)))
+    except Exception:  # Optional: fall back to the NumPy vectorized path
+        return None
+    return kernel
+
+
+def _wall_columns(walls: List[Wall]) -> Tuple[np.ndarray, ...]:
+    """
+    Stack wall attributes into NumPy columns (Structure-of-Arrays):
+    length, height, stud spacing, exterior flag, net area, gross area.
+    """
+    # Sized up front so each column is one contiguous allocation
+    n = len(walls)
+    L = np.fromiter((w.length_feet for w in walls), dtype=np.float64, count=n)
+    H = np.fromiter((w.height_feet for w in walls), dtype=np.float64, count=n)
+    SP = np.fromiter((w.stud_spacing_inches for w in walls), dtype=np.float64, count=n)
+    EXT = np.fromiter((w.is_exterior for w in walls), dtype=np.bool_, count=n)
+    NET = np.fromiter((w.net_area_sqft for w in walls), dtype=np.float64, count=n)
+    GROSS = np.fromiter((w.area_sqft for w in walls), dtype=np.float64, count=n)
+    return L, H, SP, EXT, NET, GROSS
+
+
+def _bom_matrix(L, H, SP, EXT, NET, GROSS, gravel: bool = True) -> np.ndarray:
+    """
+    Per-wall BOM rows as an (n_walls, len(BOM_COLS)) float array.
+    Uses the JIT kernel when numba is available, NumPy expressions otherwise.
+    With gravel=False the last (gravel) column is left out, for callers that
+    total it directly from the exterior walls.
+    """
+    ncols = len(BOM_COLS) if gravel else len(BOM_COLS) - 1
+
+    kernel = _wall_bom_kernel()
+    if kernel is not None:
+        out = np.empty((L.shape[0], ncols))
+        kernel(L, H, SP, NET, GROSS, out)
+    else:
+        # Vertical studs + 3 plate pieces, all at wall height
+        studs = (L * 12 / SP).astype(np.int64) + 1 + 3
+        out = np.empty((L.shape[0], ncols))
+        out[:, 0] = studs
+        out[:, 1] = studs * H
+        out[:, 2] = L * 2  # Double top plate
+        out[:, 3] = L
+        out[:, 4] = GROSS
+        out[:, 5] = GROSS
+        out[:, 6] = NET
+
+    if gravel:
+        # Footer trench 2ft wide x 0.5ft deep, exterior walls only
+        out[:, 7] = np.where(EXT, L * 2.0 * 0.5 / 27.0, 0.0)
+    return out
+
+
 class MaterialCalculator:
     """
     Calculates Bill of Materials (BOM) from building components.
@@ -194,41 +332,9 @@ class MaterialCalculator:
         - Sheathing/Drywall: Gross wall area
         - Gravel: Foundation trench (exterior walls only)
         """
-        materials = {}
-
-        # === FRAMING LUMBER ===
-        # Calculate vertical studs based on on-center spacing
-        num_studs_vertical = int((wall.length_feet * 12) / wall.stud_spacing_inches) + 1
-
-        # Add plates: 2 top plates + 1 bottom plate
-        num_studs_plates = 3
-
-        # Total studs (all at wall height)
-        total_studs = num_studs_vertical + num_studs_plates
-        materials["studs_count"] = total_studs
-        materials["stud_linear_feet"] = total_studs * wall.height_feet
-
-        # Plate lumber (runs horizontal at wall length)
-        materials["top_plate_lf"] = wall.length_feet * 2  # Double top plate
-        materials["bottom_plate_lf"] = wall.length_feet
-
-        # === SHEATHING & FINISHES ===
-        materials["sheathing_sqft"] = wall.area_sqft  # Exterior: OSB/Plywood
-        materials["drywall_sqft"] = wall.area_sqft    # Interior finish
-
-        # === INSULATION ===
-        # Only insulate the cavity (net area minus windows)
-        materials["insulation_sqft"] = wall.net_area_sqft
-
-        # === FOUNDATION GRAVEL (Exterior walls only) ===
-        if wall.is_exterior:
-            # Assume continuous footer trench: 2ft wide x 6in (0.5ft) deep
-            trench_volume_cuft = wall.length_feet * 2.0 * 0.5
-            # Convert to cubic yards (divide by 27)
-            materials["gravel_cubic_yards"] = trench_volume_cuft / 27.0
-        else:
-            materials["gravel_cubic_yards"] = 0.0
-
+        # Same per-wall row the room and project totals sum, as a dict
+        materials = dict(zip(BOM_COLS, MaterialCalculator.calculate_wall_materials_vec(wall).tolist()))
+        materials["studs_count"] = int(materials["studs_count"])
         return materials
 
     @staticmethod
@@ -237,22 +343,32 @@ class MaterialCalculator:
         Aggregate materials for an entire room.
         Returns totals across all walls.
         """
-        totals = {
-            "studs_count": 0,
-            "stud_linear_feet": 0,
-            "top_plate_lf": 0,
-            "bottom_plate_lf": 0,
-            "sheathing_sqft": 0,
-            "drywall_sqft": 0,
-            "insulation_sqft": 0,
-            "gravel_cubic_yards": 0
-        }
-
-        for wall in room.walls:
-            wall_materials = MaterialCalculator.calculate_wall_materials(wall)
-            for key in totals:
-                totals[key] += wall_materials.get(key, 0)
+        return MaterialCalculator.calculate_room_materials_vec(room)
 
+    @staticmethod
+    def calculate_wall_materials_vec(wall: Wall) -> np.ndarray:
+        """
+        Calculate materials for a single wall as a fixed-position row
+        (columns as BOM_COLS) instead of a dict.
+        """
+        return _bom_matrix(*_wall_columns([wall]))[0]
+
+    @staticmethod
+    def calculate_room_materials_vec(room: Room) -> Dict[str, float]:
+        """
+        Vectorized room aggregation (Structure-of-Arrays).
+        Computes one BOM row per wall with the same construction math rules as
+        calculate_wall_materials, then sums each column in a single reduction.
+        """
+        cols = _wall_columns(room.walls)
+        L, EXT = cols[0], cols[3]
+
+        # Gravel (last column) only depends on exterior wall length, so it is
+        # one masked sum instead of a per-wall value that is zero for interiors
+        mat = _bom_matrix(*cols, gravel=False)
+        totals = dict(zip(BOM_COLS[:-1], mat.sum(axis=0).tolist()))
+        totals["studs_count"] = int(totals["studs_count"])
+        totals["gravel_cubic_yards"] = float(L[EXT].sum()) * (2.0 * 0.5 / 27.0)
         return totals
 
 
@@ -260,13 +376,57 @@ class MaterialCalculator:
 # CODE VALIDATOR - Building Code Compliance Engine
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Represents a code violation or warning"""
     code: str  # IRC 310.1, IECC R402.1, etc.
     severity: str  # "ERROR" or "WARNING"
     message: str
     component: Optional[str] = None
+    mode: str = "FULL"  # "FAST" results must be re-checked in FULL mode before BOM/export
+
+
+# Code thresholds, references and message templates shared by every check
+_MIN_CEILING_HEIGHT = 7.0  # ft
+_MIN_CLEAR_OPENING = 5.7  # sq ft
+
+_CODE_R3051 = "IRC R305.1"
+_CODE_R3101 = "IRC R310.1"
+_CODE_R4021 = "IECC R402.1"
+_SEV_ERROR = "ERROR"
+
+# Bound templates, only called for components that actually fail
+_MSG_CEILING_HEIGHT = "Ceiling height {}ft is below minimum {}ft".format
+_MSG_NO_EGRESS_WINDOW = "Bedroom requires at least one egress window"
+_MSG_EGRESS_TOO_SMALL = (
+    "No window meets egress requirement. "
+    "Required: {} sq ft, "
+    "Largest found: {:.2f} sq ft"
+).format
+_MSG_RVALUE = "Exterior wall R-value {:.1f} below required {} for Climate Zone {}".format
+_COMPONENT_WALL = "Wall #{} ({})".format
+
+# Below this many walls thread start-up outweighs the parallel kernel
+PARALLEL_MIN_WALLS = 10_000
+
+@lru_cache(maxsize=None)
+def _thermal_deficit_kernel():
+    """
+    Compile the parallel IECC R402.1 mask kernel (exterior walls below the
+    required R-value) on first use, or return None when numba is unavailable.
+    """
+    try:
+        from numba import njit, prange
+
+        @njit(parallel=True)
+        def kernel(R, EXT, required, out):
+            for i in prange(R.shape[0]):
+                out[i] = EXT[i] and R[i] < required
+
+        kernel(np.ones(1), np.ones(1, dtype=np.bool_), 1.0, np.empty(1, dtype=np.bool_))
+    except Exception:  # Optional: fall back to the NumPy vectorized path
+        return None
+    return kernel
 
 
 class CodeValidator:
@@ -286,104 +446,237 @@ class CodeValidator:
         ClimateZone.ZONE_8: 21
     }
 
+    # Same requirements as a flat array indexed by climate zone number (index 0 unused),
+    # built from the table above; ClimateZone iterates zones 1-8 in order
+    _RVAL_BY_ZONE = np.array([0, *map(IECC_RVALUE_REQUIREMENTS.__getitem__, ClimateZone)], dtype=np.int8)
+
     @staticmethod
-    def validate_room(room: Room, project: Project) -> List[ValidationError]:
+    def validate_project_walls(r_values: np.ndarray, is_exterior: np.ndarray,
+                               zone: ClimateZone) -> np.ndarray:
         """
-        Run all code compliance checks for a room.
-        Returns list of violations (empty list = compliant).
+        Vectorized IECC R402.1 check over a column of walls.
+        Returns the indices of exterior walls whose R-value is below the
+        requirement for the climate zone. Large projects run the compare in
+        parallel across cores when numba is available.
         """
-        errors = []
+        required = CodeValidator._RVAL_BY_ZONE[zone.value]
+        kernel = _thermal_deficit_kernel() if r_values.shape[0] >= PARALLEL_MIN_WALLS else None
+        if kernel is not None:
+            deficits = np.empty(r_values.shape[0], dtype=np.bool_)
+            kernel(r_values, is_exterior, float(required), deficits)
+            return np.flatnonzero(deficits)
+        return np.flatnonzero((r_values < required) & is_exterior)
+
+    # Compact violation ids used by the batch accumulator; tuples of
+    # (room_idx, code_id, item_idx) sort into validate_room's per-room order
+    _CEILING, _EGRESS, _THERMAL = 0, 1, 2
+    _CODES = (_CODE_R3051, _CODE_R3101, _CODE_R4021)
 
-        # === CHECK 1: Minimum Ceiling Height (IRC R305.1) ===
-        errors.extend(CodeValidator._check_ceiling_height(room))
-
-        # === CHECK 2: Bedroom Egress Requirements (IRC R310.1) ===
-        if room.room_type == RoomType.BEDROOM:
-            errors.extend(CodeValidator._check_bedroom_egress(room))
+    @staticmethod
+    def validate_project(project: Project) -> List[ValidationError]:
+        """
+        Run all code compliance checks for every room in a project.
+        Errors come out in the same per-room order as validate_room, with the
+        room added to each component.
+        """
+        errors = []
+        for room_idx, room in enumerate(project.rooms, 1):
+            prefix = f"Room {room_idx} ({room.room_type.value}) - "
+            for error in CodeValidator.validate_room(room, project):
+                error.component = prefix + error.component
+                errors.append(error)
+        return errors
 
-        # === CHECK 3: Thermal Envelope (IECC R402.1) ===
-        errors.extend(CodeValidator._check_thermal_envelope(room, project))
+    @staticmethod
+    def validate_project_raw(project: Project) -> List[Tuple[int, int, int, float]]:
+        """
+        Batch compliance checks returning compact, sorted violation records
+        (room_idx, code_id, item_idx, value) instead of ValidationError objects,
+        for callers that filter or count violations before formatting any
+        (materialize_errors builds the same errors validate_project returns):
+        - ceiling: item_idx 0, value = ceiling height
+        - egress: item_idx = number of windows, value = largest clear opening
+        - thermal: item_idx = wall index within the room, value = wall R-value
+
+        Walls from all rooms are flattened into columns so the ceiling and
+        thermal checks are single vector compares; bedroom egress is a padded
+        2D reduction over every bedroom's windows.
+        """
+        rooms = project.rooms
+        walls = [wall for room in rooms for wall in room.walls]
+        n = len(walls)
+
+        R = np.fromiter((w.total_r_value for w in walls), dtype=np.float64, count=n)
+        EXT = np.fromiter((w.is_exterior for w in walls), dtype=np.bool_, count=n)
+        ROOM = np.fromiter(
+            (room_idx for room_idx, room in enumerate(rooms) for _ in room.walls),
+            dtype=np.intp, count=n
+        )
+        CH = np.fromiter((r.ceiling_height_feet for r in rooms), dtype=np.float64, count=len(rooms))
+
+        # Index of each room's first wall, to number walls within their room
+        first_wall = np.concatenate(([0], np.cumsum([len(r.walls) for r in rooms], dtype=np.intp)[:-1]))
+
+        raw = [
+            (room_idx, CodeValidator._CEILING, 0, rooms[room_idx].ceiling_height_feet)
+            for room_idx in np.flatnonzero(CH < _MIN_CEILING_HEIGHT).tolist()
+        ]
+
+        failing = CodeValidator.validate_project_walls(R, EXT, project.climate_zone)
+        raw.extend(zip(
+            ROOM[failing].tolist(),
+            [CodeValidator._THERMAL] * len(failing),
+            (failing - first_wall[ROOM[failing]]).tolist(),
+            R[failing].tolist()
+        ))
+
+        # Bedroom egress: pad each bedroom's clear openings to a common width
+        # (zeros never comply) and reduce every bedroom at once
+        bedrooms = [i for i, room in enumerate(rooms) if room.room_type == RoomType.BEDROOM]
+        openings = [
+            [w.clear_opening_sqft for wall in rooms[i].walls for w in wall.windows]
+            for i in bedrooms
+        ]
+        padded = np.zeros((len(bedrooms), max(map(len, openings), default=0)))
+        for row, opens in enumerate(openings):
+            padded[row, :len(opens)] = opens
+        compliant_room = (padded >= _MIN_CLEAR_OPENING).any(axis=1)
+        largest = padded.max(axis=1, initial=0.0)
+
+        raw.extend(
+            (bedrooms[row], CodeValidator._EGRESS, len(openings[row]), float(largest[row]))
+            for row in np.flatnonzero(~compliant_room).tolist()
+        )
 
-        return errors
+        raw.sort()
+        return raw
 
     @staticmethod
-    def _check_ceiling_height(room: Room) -> List[ValidationError]:
-        """IRC R305.1: Habitable rooms require minimum 7ft ceiling height"""
+    def materialize_errors(project: Project,
+                           raw: List[Tuple[int, int, int, float]]) -> List[ValidationError]:
+        """Build ValidationError objects from validate_project_raw records"""
+        zone = project.climate_zone.value
+        required_rvalue = project.required_rvalue
+
         errors = []
-        MIN_HEIGHT = 7.0
+        for room_idx, code_id, item_idx, value in raw:
+            room = project.rooms[room_idx]
+            component = f"{room.room_type.value}"
+            if code_id == CodeValidator._CEILING:
+                message = _MSG_CEILING_HEIGHT(value, _MIN_CEILING_HEIGHT)
+            elif code_id == CodeValidator._EGRESS and not item_idx:
+                message = _MSG_NO_EGRESS_WINDOW
+            elif code_id == CodeValidator._EGRESS:
+                message = _MSG_EGRESS_TOO_SMALL(_MIN_CLEAR_OPENING, value)
+            else:
+                message = _MSG_RVALUE(value, required_rvalue, zone)
+                component = _COMPONENT_WALL(item_idx + 1, room.walls[item_idx].framing_type.value)
 
-        if room.ceiling_height_feet < MIN_HEIGHT:
             errors.append(ValidationError(
-                code="IRC R305.1",
-                severity="ERROR",
-                message=f"Ceiling height {room.ceiling_height_feet}ft is below minimum {MIN_HEIGHT}ft",
-                component=f"{room.room_type.value}"
+                code=CodeValidator._CODES[code_id],
+                severity=_SEV_ERROR,
+                message=message,
+                component=f"Room {room_idx + 1} ({room.room_type.value}) - {component}"
             ))
 
         return errors
 
     @staticmethod
-    def _check_bedroom_egress(room: Room) -> List[ValidationError]:
+    def validate_room(room: Room, project: Project,
+                      mode: Literal["FAST", "FULL"] = "FULL") -> List[ValidationError]:
         """
-        IRC R310.1: Bedrooms require emergency escape/rescue opening.
-        Minimum clear opening: 5.7 sq ft
-        Minimum opening height: 24 inches
-        Minimum opening width: 20 inches
+        Run all code compliance checks for a room.
+        Returns list of violations (empty list = compliant).
+
+        FAST mode is meant for interactive editing: it only checks ceiling
+        height and that a bedroom has some window, skipping egress sizing and
+        the per-wall thermal check. Its results are marked mode="FAST"; run
+        FULL (the default) before calculating a BOM or exporting.
         """
-        errors = []
-        MIN_CLEAR_OPENING = 5.7  # sq ft
+        if mode == "FAST":
+            return CodeValidator._validate_room_fast(room)
+
+        is_bedroom = room.room_type == RoomType.BEDROOM
+        required_rvalue = project.required_rvalue
+
+        # === CHECK 1: Minimum Ceiling Height (IRC R305.1) ===
+        errors = CodeValidator._check_ceiling_height(room)
+
+        # Single pass over the walls gathers both the thermal deficits (CHECK 3)
+        # and the window openings needed for bedroom egress (CHECK 2)
+        thermal_errors = []
+        num_windows = 0
+        num_compliant = 0
+        max_opening = 0.0
+
+        for i, wall in enumerate(room.walls):
+            if wall.is_exterior:
+                r_value = wall.total_r_value
+                if r_value < required_rvalue:
+                    thermal_errors.append(ValidationError(
+                        code=_CODE_R4021,
+                        severity=_SEV_ERROR,
+                        message=_MSG_RVALUE(r_value, required_rvalue, project.climate_zone.value),
+                        component=_COMPONENT_WALL(i + 1, wall.framing_type.value)
+                    ))
 
-        windows = room.get_all_windows()
+            if is_bedroom:
+                num_windows += len(wall.windows)
+                for window in wall.windows:
+                    opening = window.clear_opening_sqft
+                    num_compliant += opening >= _MIN_CLEAR_OPENING
+                    max_opening = opening if opening > max_opening else max_opening
 
-        if not windows:
+        # === CHECK 2: Bedroom Egress Requirements (IRC R310.1) ===
+        if is_bedroom and not num_windows:
             errors.append(ValidationError(
-                code="IRC R310.1",
-                severity="ERROR",
-                message="Bedroom requires at least one egress window",
+                code=_CODE_R3101,
+                severity=_SEV_ERROR,
+                message=_MSG_NO_EGRESS_WINDOW,
                 component=f"{room.room_type.value}"
             ))
-            return errors
+        elif is_bedroom and not num_compliant:
+            errors.append(ValidationError(
+                code=_CODE_R3101,
+                severity=_SEV_ERROR,
+                message=_MSG_EGRESS_TOO_SMALL(_MIN_CLEAR_OPENING, max_opening),
+                component=f"{room.room_type.value}"
+            ))
+
+        # === CHECK 3: Thermal Envelope (IECC R402.1) ===
+        errors.extend(thermal_errors)
+
+        return errors
 
-        # Check if ANY window meets egress requirements
-        has_compliant_egress = False
-        for window in windows:
-            if window.clear_opening_sqft >= MIN_CLEAR_OPENING:
-                has_compliant_egress = True
-                break
+    @staticmethod
+    def _validate_room_fast(room: Room) -> List[ValidationError]:
+        """Cheap checks only: ceiling height and egress window presence"""
+        errors = CodeValidator._check_ceiling_height(room)
 
-        if not has_compliant_egress:
-            max_opening = max(w.clear_opening_sqft for w in windows)
+        if room.room_type == RoomType.BEDROOM and not any(wall.windows for wall in room.walls):
             errors.append(ValidationError(
-                code="IRC R310.1",
-                severity="ERROR",
-                message=f"No window meets egress requirement. "
-                        f"Required: {MIN_CLEAR_OPENING} sq ft, "
-                        f"Largest found: {max_opening:.2f} sq ft",
+                code=_CODE_R3101,
+                severity=_SEV_ERROR,
+                message=_MSG_NO_EGRESS_WINDOW,
                 component=f"{room.room_type.value}"
             ))
 
+        for error in errors:
+            error.mode = "FAST"
         return errors
 
     @staticmethod
-    def _check_thermal_envelope(room: Room, project: Project) -> List[ValidationError]:
-        """
-        IECC R402.1: Exterior walls must meet minimum R-value for climate zone.
-        """
+    def _check_ceiling_height(room: Room) -> List[ValidationError]:
+        """IRC R305.1: Habitable rooms require minimum 7ft ceiling height"""
         errors = []
-        required_rvalue = CodeValidator.IECC_RVALUE_REQUIREMENTS.get(
-            project.climate_zone, 20
-        )
 
-        for i, wall in enumerate(room.walls):
-            if wall.is_exterior:
-                if wall.total_r_value < required_rvalue:
-                    errors.append(ValidationError(
-                        code="IECC R402.1",
-                        severity="ERROR",
-                        message=f"Exterior wall R-value {wall.total_r_value:.1f} "
-                                f"below required {required_rvalue} for Climate Zone {project.climate_zone.value}",
-                        component=f"Wall #{i+1} ({wall.framing_type.value})"
-                    ))
+        if room.ceiling_height_feet < _MIN_CEILING_HEIGHT:
+            errors.append(ValidationError(
+                code=_CODE_R3051,
+                severity=_SEV_ERROR,
+                message=_MSG_CEILING_HEIGHT(room.ceiling_height_feet, _MIN_CEILING_HEIGHT),
+                component=f"{room.room_type.value}"
+            ))
 
         return errors
 
@@ -392,25 +685,79 @@ class CodeValidator:
 # MAIN EXECUTION - Demonstration
 # ============================================================================
 
+def render_report(room: Room, bom: Dict[str, float], violations: List[ValidationError]) -> str:
+    """
+    Render the BOM and summary sections (STEP 5 and 6 of the demo) for a room.
+    Pure function: returns the report text instead of printing it.
+    """
+    studs = int(bom['studs_count'])
+    sheets_sh = bom['sheathing_sqft'] / 32  # 4x8 sheets
+    sheets_dw = bom['drywall_sqft'] / 32
+
+    lines = [
+        # ====================================================================
+        # STEP 5: Bill of Materials
+        # ====================================================================
+        "📊 STEP 5: Calculating Bill of Materials (BOM)",
+        "-" * 80,
+        "LUMBER:",
+        f"  • Studs (2x6): {studs} pieces",
+        f"  • Stud Linear Feet: {bom['stud_linear_feet']:.1f} LF",
+        f"  • Top Plate: {bom['top_plate_lf']:.1f} LF",
+        f"  • Bottom Plate: {bom['bottom_plate_lf']:.1f} LF",
+        "",
+        "PANELS:",
+        f"  • Sheathing (OSB): {bom['sheathing_sqft']:.1f} sq ft ({sheets_sh:.1f} sheets @ 4x8)",
+        f"  • Drywall: {bom['drywall_sqft']:.1f} sq ft ({sheets_dw:.1f} sheets @ 4x8)",
+        "",
+        "INSULATION:",
+        f"  • Fiberglass Batts: {bom['insulation_sqft']:.1f} sq ft",
+        "",
+        "FOUNDATION:",
+        f"  • Gravel (3/4\" crushed): {bom['gravel_cubic_yards']:.2f} cubic yards",
+        "",
+        # ====================================================================
+        # STEP 6: Summary
+        # ====================================================================
+        "=" * 80,
+        "SUMMARY",
+        "=" * 80,
+        f"Room Type: {room.room_type.value}",
+        f"Dimensions: ~{room.walls[0].length_feet}' x {room.walls[1].length_feet}'",
+        f"Wall Assembly R-Value: {room.walls[0].total_r_value}",
+        f"Code Compliance: {'✅ PASS' if not violations else '❌ FAIL'}",
+        "Total Material Cost Drivers:",
+        f"  - {studs} studs",
+        f"  - {sheets_sh:.0f} sheets sheathing",
+        f"  - {bom['gravel_cubic_yards']:.1f} CY gravel",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 def main():
     """
     Demonstrate the parametric building configurator with a real scenario:
     - Create a Bedroom in Climate Zone 6 (Maine)
     - Intentionally create code violations to test validator
     - Calculate materials and show BOM
+
+    Output is collected in one buffer and written to stdout once at the end.
     """
+    buf = io.StringIO()
+    out = partial(print, file=buf)
 
-    print("=" * 80)
-    print("PARAMETRIC BUILDING CONFIGURATOR - SMART COMPONENT DEMO")
-    print("=" * 80)
-    print()
+    out("=" * 80)
+    out("PARAMETRIC BUILDING CONFIGURATOR - SMART COMPONENT DEMO")
+    out("=" * 80)
+    out()
 
     # ========================================================================
     # STEP 1: Define Material Assemblies (The "Kit of Parts")
     # ========================================================================
 
-    print("📦 STEP 1: Defining Wall Assembly Layers")
-    print("-" * 80)
+    out("📦 STEP 1: Defining Wall Assembly Layers")
+    out("-" * 80)
 
     # Typical exterior wall assembly (2x6 framing)
     exterior_layers = [
@@ -420,19 +767,22 @@ def main():
         MaterialLayer("Drywall", 0.5, 0.45)
     ]
 
-    # Calculate total assembly R-value
-    total_r = sum(layer.r_value for layer in exterior_layers)
-    print(f"Exterior Wall Assembly (Total R-{total_r}):")
+    # One shared, immutable assembly for every exterior wall
+    EXT_ASSEMBLY = Assembly(tuple(exterior_layers))
+
+    # Total assembly R-value (computed once by the Assembly)
+    total_r = EXT_ASSEMBLY.total_r_value
+    out(f"Exterior Wall Assembly (Total R-{total_r}):")
     for layer in exterior_layers:
-        print(f"  - {layer}")
-    print()
+        out(f"  - {layer}")
+    out()
 
     # ========================================================================
     # STEP 2: Create Building Components
     # ========================================================================
 
-    print("🏗️  STEP 2: Creating Room Components")
-    print("-" * 80)
+    out("🏗️  STEP 2: Creating Room Components")
+    out("-" * 80)
 
     # Create a small, non-compliant window (for testing validator)
     small_window = Window(
@@ -441,9 +791,9 @@ def main():
         u_factor=0.30,
         window_type="Double-Hung"
     )
-    print(f"Window: {small_window}")
-    print(f"  Clear Opening: {small_window.clear_opening_sqft:.2f} sq ft")
-    print()
+    out(f"Window: {small_window}")
+    out(f"  Clear Opening: {small_window.clear_opening_sqft:.2f} sq ft")
+    out()
 
     # Create 4 walls for a 12x10 bedroom
     north_wall = Wall(
@@ -451,7 +801,7 @@ def main():
         height_feet=8.0,
         framing_type=FramingType.STUD_2x6_16OC,
         is_exterior=True,
-        layers=exterior_layers.copy(),
+        layers=EXT_ASSEMBLY,
         windows=[small_window]  # Egress window (too small!)
     )
 
@@ -460,7 +810,7 @@ def main():
         height_feet=8.0,
         framing_type=FramingType.STUD_2x6_16OC,
         is_exterior=True,
-        layers=exterior_layers.copy()
+        layers=EXT_ASSEMBLY
     )
 
     east_wall = Wall(
@@ -468,7 +818,7 @@ def main():
         height_feet=8.0,
         framing_type=FramingType.STUD_2x6_16OC,
         is_exterior=True,
-        layers=exterior_layers.copy()
+        layers=EXT_ASSEMBLY
     )
 
     west_wall = Wall(
@@ -476,13 +826,13 @@ def main():
         height_feet=8.0,
         framing_type=FramingType.STUD_2x6_16OC,
         is_exterior=False,  # Party wall
-        layers=[]
+        layers=Assembly()
     )
 
-    print("Walls Created:")
+    out("Walls Created:")
     for i, wall in enumerate([north_wall, south_wall, east_wall, west_wall], 1):
-        print(f"  {i}. {wall} | R-Value: {wall.total_r_value}")
-    print()
+        out(f"  {i}. {wall} | R-Value: {wall.total_r_value}")
+    out()
 
     # Create the bedroom
     bedroom = Room(
@@ -499,39 +849,39 @@ def main():
         rooms=[bedroom]
     )
 
-    print(f"Room: {bedroom.room_type.value}")
-    print(f"  Floor Area: ~{bedroom.total_floor_area_sqft:.0f} sq ft")
-    print(f"  Ceiling Height: {bedroom.ceiling_height_feet} ft")
-    print(f"  Climate Zone: {project.climate_zone.value}")
-    print()
+    out(f"Room: {bedroom.room_type.value}")
+    out(f"  Floor Area: ~{bedroom.total_floor_area_sqft:.0f} sq ft")
+    out(f"  Ceiling Height: {bedroom.ceiling_height_feet} ft")
+    out(f"  Climate Zone: {project.climate_zone.value}")
+    out()
 
     # ========================================================================
     # STEP 3: Run Code Validation
     # ========================================================================
 
-    print("✅ STEP 3: Running Code Compliance Checks")
-    print("-" * 80)
+    out("✅ STEP 3: Running Code Compliance Checks")
+    out("-" * 80)
 
     validator = CodeValidator()
     violations = validator.validate_room(bedroom, project)
 
     if violations:
-        print(f"❌ Found {len(violations)} code violation(s):\n")
+        out(f"❌ Found {len(violations)} code violation(s):\n")
         for i, error in enumerate(violations, 1):
-            print(f"{i}. [{error.severity}] {error.code}")
-            print(f"   Component: {error.component}")
-            print(f"   Issue: {error.message}")
-            print()
+            out(f"{i}. [{error.severity}] {error.code}")
+            out(f"   Component: {error.component}")
+            out(f"   Issue: {error.message}")
+            out()
     else:
-        print("✅ All code checks passed!")
-        print()
+        out("✅ All code checks passed!")
+        out()
 
     # ========================================================================
     # STEP 4: Fix the Egress Window and Re-validate
     # ========================================================================
 
-    print("🔧 STEP 4: Fixing Egress Window")
-    print("-" * 80)
+    out("🔧 STEP 4: Fixing Egress Window")
+    out("-" * 80)
 
     # Replace with compliant egress window
     compliant_window = Window(
@@ -543,65 +893,29 @@ def main():
 
     north_wall.windows = [compliant_window]
 
-    print(f"New Window: {compliant_window}")
-    print(f"  Clear Opening: {compliant_window.clear_opening_sqft:.2f} sq ft (Required: 5.7)")
-    print()
+    out(f"New Window: {compliant_window}")
+    out(f"  Clear Opening: {compliant_window.clear_opening_sqft:.2f} sq ft (Required: 5.7)")
+    out()
 
     # Re-run validation
     violations = validator.validate_room(bedroom, project)
 
     if violations:
-        print(f"❌ Still have {len(violations)} violation(s)")
+        out(f"❌ Still have {len(violations)} violation(s)")
     else:
-        print("✅ All code violations resolved!")
-    print()
+        out("✅ All code violations resolved!")
+    out()
 
     # ========================================================================
     # STEP 5: Calculate Bill of Materials
     # ========================================================================
 
-    print("📊 STEP 5: Calculating Bill of Materials (BOM)")
-    print("-" * 80)
-
     calculator = MaterialCalculator()
     bom = calculator.calculate_room_materials(bedroom)
 
-    print("LUMBER:")
-    print(f"  • Studs (2x6): {int(bom['studs_count'])} pieces")
-    print(f"  • Stud Linear Feet: {bom['stud_linear_feet']:.1f} LF")
-    print(f"  • Top Plate: {bom['top_plate_lf']:.1f} LF")
-    print(f"  • Bottom Plate: {bom['bottom_plate_lf']:.1f} LF")
-    print()
-
-    print("PANELS:")
-    print(f"  • Sheathing (OSB): {bom['sheathing_sqft']:.1f} sq ft ({bom['sheathing_sqft']/32:.1f} sheets @ 4x8)")
-    print(f"  • Drywall: {bom['drywall_sqft']:.1f} sq ft ({bom['drywall_sqft']/32:.1f} sheets @ 4x8)")
-    print()
-
-    print("INSULATION:")
-    print(f"  • Fiberglass Batts: {bom['insulation_sqft']:.1f} sq ft")
-    print()
-
-    print("FOUNDATION:")
-    print(f"  • Gravel (3/4\" crushed): {bom['gravel_cubic_yards']:.2f} cubic yards")
-    print()
-
-    # ========================================================================
-    # STEP 6: Summary
-    # ========================================================================
+    out(render_report(bedroom, bom, violations), end="")
 
-    print("=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print(f"Room Type: {bedroom.room_type.value}")
-    print(f"Dimensions: ~{bedroom.walls[0].length_feet}' x {bedroom.walls[1].length_feet}'")
-    print(f"Wall Assembly R-Value: {north_wall.total_r_value}")
-    print(f"Code Compliance: {'✅ PASS' if not violations else '❌ FAIL'}")
-    print(f"Total Material Cost Drivers:")
-    print(f"  - {int(bom['studs_count'])} studs")
-    print(f"  - {bom['sheathing_sqft']/32:.0f} sheets sheathing")
-    print(f"  - {bom['gravel_cubic_yards']:.1f} CY gravel")
-    print()
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":